@@ -1,29 +1,120 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Optional, Sequence
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
 
 from akari.registry.specs import SPEC_ID_SEPARATOR, BaseSpec, SpecKindLiteral
 
 
-@dataclass
+@dataclass(slots=True)
 class IdentityRegistry:
     """
     In-memory registry for AKARI specs.
 
     This stores BaseSpec (and subclasses) keyed by their canonical id. It does not perform any execution; it is purely about identiy storage and lookup.
+
+    Secondary indexes keyed by slug name, kind and tag keep lookups and filtered listings from scanning every registered spec. The indexes are built from each spec's fields at registration time; see register() for what that means when a spec is changed later.
     """
 
     _items: Dict[str, BaseSpec] = field(default_factory=dict)
 
+    # Derived from _items; rebuilt in __post_init__ and kept up to date by register().
+    _positions: Dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _indexed_keys: Dict[str, Tuple[str, FrozenSet[str]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _by_name: Dict[str, Dict[str, BaseSpec]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _by_kind: Dict[str, Dict[str, BaseSpec]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _by_tag: Dict[str, Dict[str, BaseSpec]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Index any specs the registry was seeded with.
+        for spec in self._items.values():
+            self._positions[spec.id] = len(self._positions)
+            self._index(spec)
+
     def register(self, spec: BaseSpec) -> None:
         """
         Register a spec in the registry.
 
-        If an item with the same id already exists, it will be overwritten. In later versions, we may want stricter behaviour (e.g., raising).
+        If an item with the same id already exists, it will be overwritten in place, keeping its original registration position. In later versions, we may want stricter behaviour (e.g., raising).
+
+        The spec's name, kind and tags are indexed at this point, and only `enabled` is re-checked on every lookup. Renaming or re-tagging a registered spec therefore requires registering it again; its kind and id must not change.
         """
 
+        previous = self._items.get(spec.id)
+        if previous is None:
+            self._positions[spec.id] = len(self._positions)
+        else:
+            self._unindex(previous, replacement=spec)
+
         self._items[spec.id] = spec
+        self._index(spec)
+
+    def _index(self, spec: BaseSpec) -> None:
+        """Internal helper to add a spec to the secondary indexes."""
+        self._indexed_keys[spec.id] = (spec.name, frozenset(spec.tags))
+        self._by_name.setdefault(spec.name, {})[spec.id] = spec
+        self._add_to(self._by_kind, spec.kind, spec)
+        for tag in spec.tags:
+            self._add_to(self._by_tag, tag, spec)
+
+    def _add_to(
+        self,
+        index: Dict[str, Dict[str, BaseSpec]],
+        key: str,
+        spec: BaseSpec,
+    ) -> None:
+        """Internal helper to add a spec to one bucket, keeping buckets in registration order."""
+        members = index.setdefault(key, {})
+        if spec.id in members or not members:
+            members[spec.id] = spec
+            return
+
+        last_id = next(reversed(members))
+        members[spec.id] = spec
+        if self._positions[last_id] > self._positions[spec.id]:
+            # An overwritten spec joined a bucket it was not in before.
+            index[key] = dict(
+                sorted(members.items(), key=lambda item: self._positions[item[0]])
+            )
+
+    def _unindex(self, spec: BaseSpec, *, replacement: BaseSpec) -> None:
+        """Internal helper to drop a spec from the secondary indexes before it is replaced."""
+        # Use the keys recorded at registration; the spec may have been
+        # renamed or re-tagged since.
+        name, tags = self._indexed_keys[spec.id]
+
+        # The id fixes the kind, so the kind bucket (like any unchanged name
+        # or tag bucket) is shared with the replacement and is overwritten in
+        # place by _index(), keeping the id at its original position.
+        if name != replacement.name:
+            self._discard_from(self._by_name, name, spec.id)
+        for tag in tags:
+            if tag not in replacement.tags:
+                self._discard_from(self._by_tag, tag, spec.id)
+
+    @staticmethod
+    def _discard_from(
+        index: Dict[str, Dict[str, BaseSpec]],
+        key: str,
+        spec_id: str,
+    ) -> None:
+        """Internal helper to remove an id from one bucket of an index."""
+        members = index.get(key)
+        if members is None:
+            return
+        members.pop(spec_id, None)
+        if not members:
+            del index[key]
 
     def _resolve_by_id_or_name(
         self,
@@ -50,8 +141,8 @@ class IdentityRegistry:
         # If not found by id, try by name (must be unique)
         candidates = [
             item
-            for item in self._items.values()
-            if item.name == normalised and (item.enabled or include_disabled)
+            for item in self._by_name.get(normalised, {}).values()
+            if item.enabled or include_disabled
         ]
         if not candidates:
             return None
@@ -103,18 +194,30 @@ class IdentityRegistry:
         - kind: filter by spec.kind if provided.
         - tags: if provided, only specs that contain all given tags are returned.
         - include_disabled: include specs with enabled=False if True.
+
+        Results are returned in registration order. Kind and tag filters are served from the indexes built by register().
         """
 
-        items = list(self._items.values())
+        # Narrow down using the kind/tag indexes, walking the smallest bucket
+        # and probing the others by id.
+        buckets: List[Dict[str, BaseSpec]] = []
+        if kind is not None:
+            buckets.append(self._by_kind.get(kind, {}))
+        if tags:
+            buckets.extend(self._by_tag.get(tag, {}) for tag in set(tags))
+
+        if buckets:
+            buckets.sort(key=len)
+            smallest, others = buckets[0], buckets[1:]
+            items = [
+                spec
+                for spec_id, spec in smallest.items()
+                if all(spec_id in bucket for bucket in others)
+            ]
+        else:
+            items = list(self._items.values())
 
         if not include_disabled:
             items = [spec for spec in items if spec.enabled]
 
-        if kind is not None:
-            items = [spec for spec in items if spec.kind == kind]
-
-        if tags:
-            tag_set = set(tags)
-            items = [spec for spec in items if tag_set.issubset(spec.tags)]
-
         return items
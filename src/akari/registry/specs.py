@@ -1,13 +1,34 @@
 from __future__ import annotations
 
+import sys
+import weakref
 from dataclasses import dataclass, field
-from typing import Any, Dict, Literal, Optional, Set
+from functools import lru_cache
+from typing import AbstractSet, Any, Dict, Literal, Optional, Self, Tuple, Type
 
 SpecKindLiteral = Literal['model', 'tool', 'resource', 'agent', 'workspace']
 SPEC_ID_SEPARATOR = ':'
 
+# Live specs created through BaseSpec.intern, keyed by spec class and canonical id.
+_SPEC_POOL: weakref.WeakValueDictionary[Tuple[Type[BaseSpec], str], BaseSpec] = (
+    weakref.WeakValueDictionary()
+)
 
-@dataclass
+
+@lru_cache(maxsize=4096)
+def _normalise_name(raw_name: str) -> str:
+    """Cached implementation behind BaseSpec.normalise_name."""
+    # str.split() without arguments already drops leading/trailing
+    # whitespace, so no separate strip() pass is needed.
+    return sys.intern('_'.join(raw_name.split()).lower())
+
+
+def _format_spec_id(kind: str, slug: str) -> str:
+    """Join a kind and an already-normalised slug into an interned spec id."""
+    return sys.intern(f'{kind}{SPEC_ID_SEPARATOR}{slug}')
+
+
+@dataclass(slots=True, weakref_slot=True)
 class BaseSpec:
     """
     Base specification for any registered identity in AKARI.
@@ -15,6 +36,8 @@ class BaseSpec:
     The `id` field should follow the canonical pattern 'kind:slug', where `kind` is one of: 'model', 'tool', 'resource', 'agent', 'workspace' The slug is a lower-case, underscore-separated identifier derived from a human-readable name.
 
     This describes the common identity and configuration fields used by all higher-level spec types (models, tools, resources, agents, workspaces).
+
+    The IdentityRegistry indexes specs by `name`, `kind` and `tags` when they are registered. `kind` and `id` must not change afterwards; if `name` or `tags` change, register the spec again so the indexes pick it up.
     """
 
     # Non-default fields first (appear in __init__).
@@ -26,7 +49,9 @@ class BaseSpec:
     # Defaulted fields afterwards.
     metadata: Dict[str, Any] = field(default_factory=dict)
     config: Dict[str, Any] = field(default_factory=dict)
-    tags: Set[str] = field(default_factory=set)
+    # Any set of strings (but not a bare string) is accepted; __post_init__
+    # normalises it to a frozenset.
+    tags: AbstractSet[str] = field(default_factory=frozenset)
     enabled: bool = True
     binding: Optional[Any] = None
     version: Optional[str] = None
@@ -34,6 +59,36 @@ class BaseSpec:
     # id is not part of __init__, so it can be placed last.
     id: str = field(init=False)
 
+    def __post_init__(self) -> None:
+        # If no display_name provided, keep the original name for human-facing usage.
+        if self.display_name is None:
+            self.display_name = self.name
+
+        # Canonicalise the name into a slug for internal use.
+        slug = self.normalise_name(self.name)
+        self.name = slug
+
+        # Freeze and intern tags so they cannot change in place behind the
+        # registry's tag index. A bare string would be split into characters.
+        if isinstance(self.tags, str):
+            raise TypeError(
+                f'tags must be a set of strings, not a single string: {self.tags!r}'
+            )
+        self.tags = frozenset(sys.intern(tag) for tag in self.tags)
+
+        # Build the canonical id from kind and slug (already normalised).
+        self.id = _format_spec_id(self.kind, slug)
+
+    @classmethod
+    def intern(cls, **kwargs: Any) -> Self:
+        """
+        Construct a spec, reusing the live interned instance with the same canonical id if there is one.
+
+        This is meant for specs that are treated as immutable once built (e.g. repeatedly reloaded configs). The returned instance is shared, so mutating it affects every holder. If an instance of the same class with the same id is already live, it is returned as-is and the other given fields are not applied.
+        """
+        spec = cls(**kwargs)
+        return _SPEC_POOL.setdefault((cls, spec.id), spec)
+
     @classmethod
     def normalise_name(cls, raw_name: str) -> str:
         """
@@ -44,105 +99,56 @@ class BaseSpec:
         - collapse internal whitespace to single underscores,
         - convert to lower case.
 
+        Results are cached, since the same names recur across registries and config reloads.
+
         Example:
             "  Iris   Classifier " -> "iris_classifier"
         """
-        normalised_name = raw_name.strip()
-        slug = '_'.join(normalised_name.split()).lower()
-        return slug
+        return _normalise_name(raw_name)
 
     @classmethod
     def build_spec_id(cls, kind: SpecKindLiteral, name: str) -> str:
         """
         Build a canonical spec identifier of the form 'kind:slug'.
 
-        The slug is derived from the given name by normalising it:
+        The slug is derived from the given name by normalising it. The resulting id is interned, since ids are used as registry keys.
 
         Example:
             kind="model", name="Iris Classifier" -> "model:iris_classifier"
         """
-        slug = cls.normalise_name(name)
-        return f'{kind}{SPEC_ID_SEPARATOR}{slug}'
+        return _format_spec_id(kind, cls.normalise_name(name))
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelSpec(BaseSpec):
     """Specification for a model identiy."""
 
     kind: SpecKindLiteral = field(default='model', init=False)
 
-    def __post_init__(self) -> None:
-        # If no display_name provided, keep the original name for human-facing usage.
-        if self.display_name is None:
-            self.display_name = self.name
-
-        # Canonicalise the name into a slug for internal use.
-        slug = self.normalise_name(self.name)
-        self.name = slug
-
-        # Build the canonical id from kind and slug.
-        self.id = self.build_spec_id('model', self.name)
-
 
-@dataclass
+@dataclass(slots=True)
 class ToolSpec(BaseSpec):
     """Specification for a tool identity."""
 
     kind: SpecKindLiteral = field(default='tool', init=False)
 
-    def __post_init__(self) -> None:
-        if self.display_name is None:
-            self.display_name = self.name
-
-        slug = self.normalise_name(self.name)
-        self.name = slug
-
-        self.id = self.build_spec_id('tool', self.name)
-
 
-@dataclass
+@dataclass(slots=True)
 class ResourceSpec(BaseSpec):
     """Specification for a resource identity."""
 
     kind: SpecKindLiteral = field(default='resource', init=False)
 
-    def __post_init__(self) -> None:
-        if self.display_name is None:
-            self.display_name = self.name
-
-        slug = self.normalise_name(self.name)
-        self.name = slug
-
-        self.id = self.build_spec_id('resource', self.name)
-
 
-@dataclass
+@dataclass(slots=True)
 class AgentSpec(BaseSpec):
     """Specification for an agent identity."""
 
     kind: SpecKindLiteral = field(default='agent', init=False)
 
-    def __post_init__(self) -> None:
-        if self.display_name is None:
-            self.display_name = self.name
-
-        slug = self.normalise_name(self.name)
-        self.name = slug
-
-        self.id = self.build_spec_id('agent', self.name)
-
 
-@dataclass
+@dataclass(slots=True)
 class WorkspaceSpec(BaseSpec):
     """Specification for a workspace identity."""
 
     kind: SpecKindLiteral = field(default='workspace', init=False)
-
-    def __post_init__(self) -> None:
-        if self.display_name is None:
-            self.display_name = self.name
-
-        slug = self.normalise_name(self.name)
-        self.name = slug
-
-        self.id = self.build_spec_id('workspace', self.name)
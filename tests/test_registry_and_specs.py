@@ -1,5 +1,9 @@
+from typing import Tuple
+
+import pytest
+
 from akari.registry.registry import IdentityRegistry
-from akari.registry.specs import AgentSpec, ModelSpec, ToolSpec
+from akari.registry.specs import AgentSpec, BaseSpec, ModelSpec, ToolSpec
 
 
 def test_model_spec_normalises_name_and_generates_id() -> None:
@@ -15,6 +19,12 @@ def test_model_spec_normalises_name_and_generates_id() -> None:
     assert spec.id == 'model:iris_classifier'
 
 
+def test_normalise_name_collapses_any_whitespace_only() -> None:
+    assert BaseSpec.normalise_name('\t Iris\n\u00a0Classifier ') == 'iris_classifier'
+    assert BaseSpec.normalise_name('iris__v2') == 'iris__v2'
+    assert BaseSpec.normalise_name('   ') == ''
+
+
 def test_tool_and_agent_spec_share_same_naming_conventions() -> None:
     tool = ToolSpec(
         name=' Multiply Numbers ',
@@ -34,7 +44,8 @@ def test_tool_and_agent_spec_share_same_naming_conventions() -> None:
     assert agent.id == 'agent:planner_agent'
 
 
-def test_registry_get_by_id_and_human_name() -> None:
+@pytest.fixture(scope='module')
+def registry_with_iris_spec() -> Tuple[IdentityRegistry, ModelSpec]:
     registry = IdentityRegistry()
 
     spec = ModelSpec(
@@ -42,17 +53,25 @@ def test_registry_get_by_id_and_human_name() -> None:
         runtime='callable',
     )
     registry.register(spec)
+    return registry, spec
 
-    by_id = registry.get('model:iris_classifier')
-    assert by_id is spec
 
-    by_name_1 = registry.get('Iris Classifier')
-    by_name_2 = registry.get('iris classifier')
-    by_name_3 = registry.get('  IRIS   Classifier  ')
+@pytest.mark.parametrize(
+    'key',
+    [
+        'model:iris_classifier',
+        'Iris Classifier',
+        'iris classifier',
+        '  IRIS   Classifier  ',
+    ],
+)
+def test_registry_get_by_id_and_human_name(
+    registry_with_iris_spec: Tuple[IdentityRegistry, ModelSpec],
+    key: str,
+) -> None:
+    registry, spec = registry_with_iris_spec
 
-    assert by_name_1 is spec
-    assert by_name_2 is spec
-    assert by_name_3 is spec
+    assert registry.get(key) is spec
 
 
 def test_registry_disable_and_list_filters_by_enabled() -> None:
@@ -81,3 +100,169 @@ def test_registry_disable_and_list_filters_by_enabled() -> None:
 
     models_with_disabled = registry.list(kind='model', include_disabled=True)
     assert model in models_with_disabled
+
+
+def test_registry_name_lookup_is_none_when_ambiguous() -> None:
+    registry = IdentityRegistry()
+
+    model = ModelSpec(
+        name='Iris',
+        runtime='callable',
+    )
+    tool = ToolSpec(
+        name='Iris',
+        runtime='callable',
+    )
+    registry.register(model)
+    registry.register(tool)
+
+    assert registry.get('iris') is None
+    assert registry.get('model:iris') is model
+
+    registry.disable('tool:iris')
+    assert registry.get('iris') is model
+    assert registry.get('iris', include_disabled=True) is None
+
+
+def test_registry_register_overwrites_name_lookup() -> None:
+    registry = IdentityRegistry()
+
+    first = ModelSpec(
+        name='Iris Classifier',
+        runtime='callable',
+    )
+    second = ModelSpec(
+        name='Iris Classifier',
+        runtime='sklearn',
+    )
+    registry.register(first)
+    registry.register(second)
+
+    assert registry.get('Iris Classifier') is second
+    assert registry.list(kind='model') == [second]
+
+
+def test_registry_list_filters_by_kind_and_tags() -> None:
+    registry = IdentityRegistry()
+
+    iris = ModelSpec(
+        name='Iris Classifier',
+        runtime='callable',
+        tags={'iris', 'demo'},
+    )
+    digits = ModelSpec(
+        name='Digits Classifier',
+        runtime='callable',
+        tags={'demo'},
+    )
+    loader = ToolSpec(
+        name='Iris Loader',
+        runtime='callable',
+        tags={'iris'},
+    )
+    for spec in (iris, digits, loader):
+        registry.register(spec)
+
+    assert registry.list(tags=['iris']) == [iris, loader]
+    assert registry.list(kind='model', tags=['demo']) == [iris, digits]
+    assert registry.list(kind='model', tags=['iris', 'demo']) == [iris]
+    assert registry.list(kind='tool', tags=['demo']) == []
+    assert registry.list(tags=['unknown']) == []
+    assert registry.list(kind='agent') == []
+
+
+def test_base_spec_builds_id_from_its_kind() -> None:
+    spec = BaseSpec(
+        name='Shared Notes',
+        kind='resource',
+        runtime='file',
+    )
+
+    assert spec.display_name == 'Shared Notes'
+    assert spec.name == 'shared_notes'
+    assert spec.id == 'resource:shared_notes'
+
+
+def test_spec_intern_reuses_live_instance_by_id() -> None:
+    first = ModelSpec.intern(name='Iris Classifier', runtime='callable')
+    second = ModelSpec.intern(name='iris classifier', runtime='callable')
+    other = ToolSpec.intern(name='Iris Classifier', runtime='callable')
+
+    assert second is first
+    assert other is not first
+    assert other.id == 'tool:iris_classifier'
+
+
+def test_spec_tags_are_frozen_on_construction() -> None:
+    spec = ToolSpec(
+        name='Multiply Numbers',
+        runtime='callable',
+        tags={'math', 'demo'},
+    )
+
+    assert isinstance(spec.tags, frozenset)
+    assert spec.tags == {'math', 'demo'}
+
+    with pytest.raises(TypeError):
+        ToolSpec(name='Multiply Numbers', runtime='callable', tags='math')
+
+
+def test_registry_list_keeps_registration_order_after_overwrite() -> None:
+    registry = IdentityRegistry()
+
+    first = ModelSpec(name='A', runtime='callable')
+    second = ModelSpec(name='B', runtime='callable', tags={'x'})
+    registry.register(first)
+    registry.register(second)
+
+    replacement = ModelSpec(name='A', runtime='sklearn', tags={'x'})
+    registry.register(replacement)
+
+    assert registry.list() == [replacement, second]
+    assert registry.list(kind='model') == [replacement, second]
+    assert registry.list(tags=['x']) == [replacement, second]
+
+
+def test_registry_reindexes_renamed_spec_on_register() -> None:
+    registry = IdentityRegistry()
+
+    spec = ToolSpec(
+        name='Multiply Numbers',
+        runtime='callable',
+        tags={'math'},
+    )
+    registry.register(spec)
+
+    spec.name = 'product'
+    spec.tags = frozenset({'arithmetic'})
+    registry.register(spec)
+
+    assert registry.get('product') is spec
+    assert registry.get('multiply numbers') is None
+    assert registry.list(tags=['arithmetic']) == [spec]
+    assert registry.list(tags=['math']) == []
+
+
+def test_spec_intern_pool_is_per_class() -> None:
+    base = BaseSpec.intern(name='Shared', kind='model', runtime='callable')
+    model = ModelSpec.intern(name='Shared', runtime='callable')
+
+    assert base.id == model.id == 'model:shared'
+    assert type(model) is ModelSpec
+    assert model is not base
+    assert ModelSpec.intern(name='Shared', runtime='callable') is model
+
+
+def test_registry_seeded_with_items_indexes_them() -> None:
+    spec = ModelSpec(
+        name='Iris Classifier',
+        runtime='callable',
+        tags={'iris'},
+    )
+    registry = IdentityRegistry(_items={spec.id: spec})
+
+    assert registry.get('iris classifier') is spec
+    assert registry.list(kind='model') == [spec]
+    assert registry.list(tags=['iris']) == [spec]
+    assert registry == IdentityRegistry(_items={spec.id: spec})
+    assert repr(registry).count('ModelSpec(') == 1